@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+from rgb_core import FRAME_RECORD
+
+# 레코드에는 포맷 정보가 없으므로 데이터 앞부분(매직 바이트)으로 확장자를 정함
+# (rgb_logger.py의 IMAGE_EXT를 바꿔도 추출 결과가 실제 포맷과 맞게)
+IMAGE_MAGIC = [
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+]
+
+
+def guess_image_ext(data: bytes) -> str:
+    for magic, ext in IMAGE_MAGIC:
+        if data.startswith(magic):
+            return ext
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return "bin"
+
+
+def read_frame_at(blob, offset: int):
+    blob.seek(offset)
+    header = blob.read(FRAME_RECORD.size)
+    if len(header) < FRAME_RECORD.size:
+        return None
+    t_ms, length = FRAME_RECORD.unpack(header)
+    data = blob.read(length)
+    if len(data) < length:
+        return None
+    return t_ms, data
+
+
+def iter_frames(blob):
+    offset = 0
+    while True:
+        rec = read_frame_at(blob, offset)
+        if rec is None:
+            return
+        yield offset, rec[0], rec[1]
+        offset += FRAME_RECORD.size + len(rec[1])
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python extract_frames.py <frames.bin> [출력폴더] [offset]")
+        sys.exit(1)
+
+    blob_path = Path(sys.argv[1])
+    out_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else blob_path.parent / "images"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with open(blob_path, "rb") as blob:
+        if len(sys.argv) > 3:
+            # CSV의 image_path("frames.bin@<offset>")에 있는 offset 하나만 추출
+            rec = read_frame_at(blob, int(sys.argv[3]))
+            frames = [] if rec is None else [(int(sys.argv[3]), rec[0], rec[1])]
+        else:
+            frames = iter_frames(blob)
+
+        for _, t_ms, data in frames:
+            (out_dir / f"{t_ms}.{guess_image_ext(data)}").write_bytes(data)
+            count += 1
+
+    print(f"[DONE] {count}개 프레임 추출: {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
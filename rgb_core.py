@@ -0,0 +1,48 @@
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+
+# rgb_gui.py / rgb_logger.py / extract_frames.py 공용 (cv2/numpy 없이 import 가능하게 유지)
+
+# frames.bin 레코드 헤더
+FRAME_RECORD = struct.Struct("<QI")   # unix_ms, 이미지 바이트 길이
+
+
+def session_stamp():
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+
+def write_bytes_fd(path: Path, data):
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            n = os.write(fd, view)
+            view = view[n:]
+    finally:
+        os.close(fd)
+
+
+def sync_files(paths):
+    # 파일마다 fdatasync하면 저장 스레드가 SD 카드 flush를 매번 기다리므로
+    # 기록한 경로를 모아 CSV 동기화 주기에 한 번에 디스크까지 내림
+    # 실패한 파일이 있어도 나머지는 계속 처리하고 목록은 항상 비움 (다음 주기까지 같은 오류가 반복되지 않게)
+    first_error = None
+    for path in paths:
+        try:
+            fd = os.open(str(path), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fdatasync(fd)
+            # 다시 읽지 않는 이미지라 기록이 끝난 페이지는 캐시에서 내려 RAM을 아낌
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            if first_error is None:
+                first_error = e
+        finally:
+            os.close(fd)
+    paths.clear()
+    if first_error is not None:
+        raise first_error
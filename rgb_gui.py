@@ -1,21 +1,28 @@
 import sys
 import csv
+import errno
 import time
 import shutil
 import os
 import re
 import subprocess
 import queue
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from collections import deque
+
+# 작은 프레임 연산에서 OpenMP 스레드 동기화 비용이 더 크므로 단일 스레드로 고정 (cv2 import 전에 설정)
+os.environ.setdefault("OMP_NUM_THREADS", "1")
 
 import cv2
 import numpy as np
-from picamera2 import Picamera2
+import simplejpeg
+from picamera2 import Picamera2, MappedArray
 
 from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal, QObject
-from PyQt5.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPainterPath, QPen, QColor, QFont
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -23,9 +30,15 @@ from PyQt5.QtWidgets import (
     QComboBox, QMessageBox, QInputDialog, QLineEdit
 )
 
+from rgb_core import session_stamp, sync_files, write_bytes_fd
+
+cv2.setNumThreads(1)
+
 # ================== 고정 설정 ==================
 WIDTH, HEIGHT = 1280, 720
 PREVIEW_MAX_W = 480
+# 프리뷰는 표시용이라 가장 빠른 최근접 보간 사용 (화질 우선이면 cv2.INTER_AREA)
+PREVIEW_INTERPOLATION = cv2.INTER_NEAREST
 
 RGB_LOG_INTERVAL_SEC = 60.0
 IMAGE_LOG_INTERVAL_SEC = 300.0
@@ -33,6 +46,7 @@ IMAGE_LOG_INTERVAL_SEC = 300.0
 SAVE_IMAGE = True
 IMAGE_EXT = "jpg"
 JPG_QUALITY = 95
+IMAGE_IS_JPEG = IMAGE_EXT.lower() in ("jpg", "jpeg")
 DATA_ROOT = Path("/home/pi/Ainanobio_data")
 
 POINTS = [
@@ -59,31 +73,70 @@ ROI_EXPAND_Y = 30
 
 PLOT_MAX_POINTS = 240
 DISK_UPDATE_SEC = 10.0
+DISK_UPDATE_RECORDING_SEC = 30.0
 
 PREVIEW_INTERVAL_MS = 150
 INFO_INTERVAL_MS = 1000
 USB_INTERVAL_MS = 8000
 
 SAVE_QUEUE_MAX = 32
+COPY_WORKERS = 4
+COPY_PROGRESS_EVERY = 50   # 이 파일 수마다 복사 진행 상황 표시
+# CSV는 행마다 flush하지 않고 이 간격마다 flush + fsync (전원 차단 시 손실 상한)
+CSV_SYNC_SEC = 60.0
+# 행 주기(RGB_LOG_INTERVAL_SEC)와 같은 간격이라 지터로 조금 짧게 들어온 행에서 동기화를 건너뛰지 않도록 여유를 둠
+CSV_SYNC_SLACK_SEC = 5.0
 # ===============================================
 
 ADMIN_CLOSE_PASSWORD = "2472"
 
 
-def session_stamp():
-    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-
-def now_ms():
-    return int(time.time() * 1000)
+def to_ms(t):
+    return int(t * 1000)
 
 
-def resize_for_preview(frame_bgr, max_w):
-    h, w = frame_bgr.shape[:2]
+def preview_geometry(w, h, max_w):
     if w <= max_w:
-        return frame_bgr
+        return 1.0, w, h
     scale = max_w / w
-    return cv2.resize(frame_bgr, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+    return scale, int(w * scale), int(h * scale)
+
+
+def resize_for_preview(frame_rgb, max_w, dst=None):
+    h, w = frame_rgb.shape[:2]
+    # 미리 할당된 dst가 있으면 그 크기가 곧 프리뷰 크기 (매 프레임 다시 계산하지 않음)
+    if dst is not None:
+        ph, pw = dst.shape[:2]
+    else:
+        _, pw, ph = preview_geometry(w, h, max_w)
+    if pw == w:
+        if dst is None:
+            return frame_rgb
+        np.copyto(dst, frame_rgb)
+        return dst
+
+    # 정수배 축소(예: 1280 -> 640)는 보간 없이 stride 슬라이스로 처리
+    step = w // pw
+    if w % pw == 0 and h % step == 0 and h // step == ph:
+        if dst is None:
+            return np.ascontiguousarray(frame_rgb[::step, ::step])
+        np.copyto(dst, frame_rgb[::step, ::step])
+        return dst
+
+    return cv2.resize(frame_rgb, (pw, ph), dst=dst, interpolation=PREVIEW_INTERPOLATION)
+
+
+def scale_points(points, scale):
+    return [(pid, int(round(x * scale)), int(round(y * scale))) for pid, x, y in points]
+
+
+def scale_roi(roi, scale):
+    return tuple(int(round(v * scale)) for v in roi)
+
+
+def swap_rb_channels(frame):
+    # RGB<->BGR 채널 순서만 뒤집는 연속 복사본 (cvtColor의 범용 변환 경로를 거치지 않음)
+    return np.ascontiguousarray(frame[..., ::-1])
 
 
 def get_roi_from_points(points):
@@ -129,34 +182,27 @@ def get_inner_roi_from_grid_points(grid_points, rows, cols, inset_cells=1):
     return get_roi_from_points(inner_points)
 
 
-def compute_avg_from_rgb_list(rgb_values):
-    valid = [(r, g, b) for r, g, b in rgb_values if r != "" and g != "" and b != ""]
-    if not valid:
+def mean_rgb_masked(pixels, valid):
+    if not valid.any():
         return "", "", ""
 
-    avg_r = round(sum(r for r, _, _ in valid) / len(valid), 1)
-    avg_g = round(sum(g for _, g, _ in valid) / len(valid), 1)
-    avg_b = round(sum(b for _, _, b in valid) / len(valid), 1)
-    return avg_r, avg_g, avg_b
+    mean_r, mean_g, mean_b = pixels[valid].mean(axis=0)
+    return round(float(mean_r), 1), round(float(mean_g), 1), round(float(mean_b), 1)
 
 
-def split_grid_samples_top_middle_bottom(grid_samples, rows=GRID_ROWS, cols=GRID_COLS):
+def split_grid_avgs_top_middle_bottom(pixels, valid, rows=GRID_ROWS, cols=GRID_COLS):
     expected = rows * cols
-    samples = list(grid_samples[:expected])
-
-    if len(samples) != expected:
+    if len(pixels) != expected:
         return ("", "", ""), ("", "", ""), ("", "", "")
 
-    row_groups = [samples[i * cols:(i + 1) * cols] for i in range(rows)]
-    top_rows = row_groups[: rows // 3]
-    middle_rows = row_groups[rows // 3: (rows // 3) * 2]
-    bottom_rows = row_groups[(rows // 3) * 2:]
-
-    def avg_for_rows(group_rows):
-        rgbs = [(r, g, b) for row in group_rows for _, _, _, r, g, b in row]
-        return compute_avg_from_rgb_list(rgbs)
-
-    return avg_for_rows(top_rows), avg_for_rows(middle_rows), avg_for_rows(bottom_rows)
+    # 행 우선 배치라 행 묶음은 연속 구간 - 구간별 평균을 NumPy로 바로 계산
+    top_end = (rows // 3) * cols
+    middle_end = (rows // 3) * 2 * cols
+    return (
+        mean_rgb_masked(pixels[:top_end], valid[:top_end]),
+        mean_rgb_masked(pixels[top_end:middle_end], valid[top_end:middle_end]),
+        mean_rgb_masked(pixels[middle_end:], valid[middle_end:]),
+    )
 
 
 def generate_grid_points_from_roi(left, top, right, bottom, rows, cols):
@@ -175,8 +221,9 @@ def generate_grid_points_from_roi(left, top, right, bottom, rows, cols):
     return pts
 
 
-def draw_roi_and_grid(frame_bgr, roi, grid_points=None):
-    out = frame_bgr.copy()
+# 프레임은 RGB 순서 그대로 쓰므로 그리기 색상도 (R, G, B)로 지정
+def draw_roi_and_grid(frame_rgb, roi, grid_points=None):
+    out = frame_rgb.copy()
     left, top, right, bottom = roi
 
     cv2.rectangle(out, (left, top), (right, bottom), (0, 255, 0), 2)
@@ -185,24 +232,23 @@ def draw_roi_and_grid(frame_bgr, roi, grid_points=None):
 
     if grid_points:
         for pid, x, y in grid_points:
-            cv2.circle(out, (x, y), 2, (0, 255, 255), -1)
+            cv2.circle(out, (x, y), 2, (255, 255, 0), -1)
             if SHOW_POINT_LABELS:
                 cv2.putText(out, pid, (x + 4, y - 4),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 255, 255), 1, cv2.LINE_AA)
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.35, (255, 255, 0), 1, cv2.LINE_AA)
     return out
 
 
-def safe_rgb(frame_bgr, x, y):
-    h, w = frame_bgr.shape[:2]
-    if not (0 <= x < w and 0 <= y < h):
-        return None
-    b, g, r = frame_bgr[y, x]
-    return int(r), int(g), int(b)
+def build_overlay_sprite(roi, grid_points, width, height):
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    canvas = draw_roi_and_grid(canvas, roi, grid_points)
+    ys, xs = np.nonzero(canvas.any(axis=2))
+    return (ys, xs), canvas[ys, xs]
 
 
-def get_roi_mean_rgb(frame_bgr, roi):
+def get_roi_mean_rgb(frame_rgb, roi):
     left, top, right, bottom = roi
-    h, w = frame_bgr.shape[:2]
+    h, w = frame_rgb.shape[:2]
 
     left = max(0, min(left, w - 1))
     right = max(0, min(right, w - 1))
@@ -212,39 +258,34 @@ def get_roi_mean_rgb(frame_bgr, roi):
     if left > right or top > bottom:
         return None
 
-    roi_img = frame_bgr[top:bottom + 1, left:right + 1]
+    roi_img = frame_rgb[top:bottom + 1, left:right + 1]
     if roi_img.size == 0:
         return None
 
-    mean_b, mean_g, mean_r = roi_img.mean(axis=(0, 1))
+    mean_r, mean_g, mean_b = roi_img.mean(axis=(0, 1))
     return round(float(mean_r), 1), round(float(mean_g), 1), round(float(mean_b), 1)
 
 
-def sample_grid_rgb(frame_bgr, grid_points):
-    samples = []
-    valid_rs = []
-    valid_gs = []
-    valid_bs = []
+def point_coord_arrays(points):
+    xs = np.array([x for _, x, _ in points], dtype=np.intp)
+    ys = np.array([y for _, _, y in points], dtype=np.intp)
+    return xs, ys
 
-    for pid, x, y in grid_points:
-        rgb = safe_rgb(frame_bgr, x, y)
-        if rgb is None:
-            samples.append((pid, x, y, "", "", ""))
-        else:
-            r, g, b = rgb
-            samples.append((pid, x, y, r, g, b))
-            valid_rs.append(r)
-            valid_gs.append(g)
-            valid_bs.append(b)
-
-    if valid_rs:
-        avg_r = round(sum(valid_rs) / len(valid_rs), 1)
-        avg_g = round(sum(valid_gs) / len(valid_gs), 1)
-        avg_b = round(sum(valid_bs) / len(valid_bs), 1)
-    else:
-        avg_r, avg_g, avg_b = "", "", ""
 
-    return samples, (avg_r, avg_g, avg_b)
+def sample_grid_rgb(frame_rgb, xs, ys, rows=GRID_ROWS, cols=GRID_COLS):
+    h, w = frame_rgb.shape[:2]
+    valid = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    # 모든 포인트를 한 번의 fancy-index로 읽음 (범위 밖 좌표는 clip 후 아래에서 빈 값 처리)
+    pixels = frame_rgb[np.clip(ys, 0, h - 1), np.clip(xs, 0, w - 1)]
+
+    # CSV에 들어갈 [x, y, R, G, B] * N 평탄화 리스트를 좌표/픽셀 배열에서 한 번에 만듦
+    grid_values = np.column_stack((xs, ys, pixels)).ravel().tolist()
+    for i in np.flatnonzero(~valid).tolist():
+        grid_values[i * 5 + 2:i * 5 + 5] = ["", "", ""]
+
+    grid_avg = mean_rgb_masked(pixels, valid)
+    zone_avgs = split_grid_avgs_top_middle_bottom(pixels, valid, rows, cols)
+    return grid_values, grid_avg, zone_avgs
 
 
 def fmt_hms(seconds: int) -> str:
@@ -263,49 +304,93 @@ def fmt_bytes(n: int) -> str:
 
 # ===================== USB / Session helpers =====================
 
-def find_usb_mounts():
+def parse_usb_mounts(lines):
     mounts = []
-    try:
-        with open("/proc/mounts", "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) < 2:
-                    continue
-                mnt = parts[1]
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        mnt = parts[1]
 
-                if not (mnt.startswith("/media/") or mnt.startswith("/run/media/")):
-                    continue
+        if not (mnt.startswith("/media/") or mnt.startswith("/run/media/")):
+            continue
 
-                if mnt in ("/media", "/media/pi", "/run/media", "/run/media/pi"):
-                    continue
+        if mnt in ("/media", "/media/pi", "/run/media", "/run/media/pi"):
+            continue
 
-                if os.path.isdir(mnt):
-                    mounts.append(mnt)
-    except Exception:
-        pass
+        if os.path.isdir(mnt):
+            mounts.append(mnt)
 
     mounts = sorted(list(dict.fromkeys(mounts)))
     return mounts
 
 
+def find_usb_mounts():
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            return parse_usb_mounts(f)
+    except Exception:
+        return []
+
+
+class UsbMountWatcher:
+    # /proc/self/mounts는 마운트 테이블이 바뀌면 poll()에 POLLPRI를 알려줌
+    # 바뀌었을 때만 다시 읽고 평소에는 이전 결과를 그대로 돌려줌
+    def __init__(self):
+        self._f = None
+        self._poller = None
+        self._mounts = None
+        try:
+            self._f = open("/proc/self/mounts", "r", encoding="utf-8")
+            self._poller = select.poll()
+            self._poller.register(self._f, select.POLLPRI | select.POLLERR)
+        except Exception:
+            self._f = None
+            self._poller = None
+
+    def mounts(self):
+        if self._f is None:
+            return find_usb_mounts()
+        if self._mounts is None or self._poller.poll(0):
+            try:
+                # 다음 변경 알림은 poll()이 POLLPRI를 돌려줄 때 커널이 다시 걸어두므로 여기선 처음부터 다시 읽기만 함
+                self._f.seek(0)
+                self._mounts = parse_usb_mounts(self._f.read().splitlines())
+            except Exception:
+                self._mounts = find_usb_mounts()
+        return list(self._mounts)
+
+    def close(self):
+        # 닫은 뒤 호출되면 /proc/mounts를 매번 읽는 방식으로 동작
+        if self._f is not None:
+            try:
+                self._f.close()
+            except Exception:
+                pass
+        self._f = None
+        self._poller = None
+
+
+SESSION_DIR_RE = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
+
+
 def is_session_dir_name(name: str) -> bool:
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$", name))
+    return bool(SESSION_DIR_RE.match(name))
 
 
 def list_sessions(data_root: Path):
     out = []
-    if not data_root.exists():
+    # scandir의 DirEntry는 d_type으로 폴더 여부를 알려줘 항목마다 stat를 하지 않음
+    try:
+        with os.scandir(data_root) as it:
+            for e in it:
+                if is_session_dir_name(e.name) and e.is_dir():
+                    out.append(e.name)
+    except FileNotFoundError:
         return out
 
-    for p in data_root.iterdir():
-        if p.is_dir() and is_session_dir_name(p.name):
-            out.append(p)
-
-    return sorted(out, key=lambda x: x.name, reverse=True)
-
-
-def recent_sessions(data_root: Path, limit=3):
-    return list_sessions(data_root)[:limit]
+    # 폴더 이름(타임스탬프)만 돌려줌 - 경로가 필요한 곳에서만 DATA_ROOT / name으로 만듦
+    return sorted(out, reverse=True)
 
 
 def session_display_name(session_name: str):
@@ -353,13 +438,79 @@ def sync_filesystem():
         pass
 
 
+def copy_file_sequential(src, dst):
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        # 처음부터 끝까지 한 번 읽는 파일이라 readahead를 키우고, 다 읽은 뒤엔 페이지 캐시에서 내림
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        size = os.fstat(src_fd).st_size
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                offset = 0
+                while offset < size:
+                    n = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if n == 0:
+                        break
+                    offset += n
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                    raise
+                # sendfile을 지원하지 않는 파일시스템이면 1MiB 단위 일반 복사로 처음부터 다시 씀
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                with os.fdopen(src_fd, "rb", closefd=False) as fsrc, os.fdopen(dst_fd, "wb", closefd=False) as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+        finally:
+            os.close(dst_fd)
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+
+
+def copy_tree_parallel(src, dst, workers=COPY_WORKERS, progress=None):
+    # 폴더 구조는 먼저 순서대로 만들고, 파일 복사(JPEG 다수)만 스레드 풀로 병렬 처리
+    dirs = []
+    jobs = []
+    for root, _, files in os.walk(src):
+        out_dir = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(out_dir, exist_ok=True)
+        dirs.append((root, out_dir))
+        for name in files:
+            jobs.append((os.path.join(root, name), os.path.join(out_dir, name)))
+
+    total = len(jobs)
+    copied = 0
+    lock = threading.Lock()
+
+    def copy_job(job):
+        nonlocal copied
+        copy_file_sequential(*job)
+        with lock:
+            copied += 1
+            n = copied
+        if progress is not None and (n % COPY_PROGRESS_EVERY == 0 or n == total):
+            progress(n, total)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in pool.map(copy_job, jobs):
+            pass
+
+    # 파일을 다 넣은 뒤에 폴더 시간/권한을 원본과 맞춤 (copytree처럼, 하위 폴더부터)
+    for root, out_dir in reversed(dirs):
+        shutil.copystat(root, out_dir)
+    return total
+
+
 class CopyWorker(QThread):
     log = pyqtSignal(str)
     done = pyqtSignal(bool, str)
 
     def __init__(self, src_dirs, dst_root):
         super().__init__()
-        self.src_dirs = [Path(p) for p in src_dirs]
+        self.src_dirs = list(src_dirs)
         self.dst_root = Path(dst_root)
 
     def run(self):
@@ -373,7 +524,10 @@ class CopyWorker(QThread):
                 if dst.exists():
                     shutil.rmtree(dst)
 
-                shutil.copytree(src, dst)
+                copy_tree_parallel(
+                    src, dst,
+                    progress=lambda n, total, name=src.name: self.log.emit(f"복사 중: {name} ({n}/{total})"),
+                )
 
             self.log.emit("복사 완료 후 동기화 중...")
             sync_filesystem()
@@ -387,12 +541,16 @@ class CameraWorker(QThread):
     frame_ready = pyqtSignal(object)
     camera_error = pyqtSignal(str)
 
-    def __init__(self, width, height, interval_ms):
+    def __init__(self, width, height, interval_ms, analyze_frame):
         super().__init__()
         self.width = width
         self.height = height
         self.interval_ms = interval_ms
+        self.analyze_frame = analyze_frame
+        self.render_preview = True
+        self.want_full_frame = False
         self._running = True
+        self._result_pending = threading.Event()
         self.picam2 = None
 
     def run(self):
@@ -409,12 +567,24 @@ class CameraWorker(QThread):
 
             while self._running:
                 t0 = time.perf_counter()
-                frame = self.picam2.capture_array()
-                if frame is None:
-                    continue
-
-                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                self.frame_ready.emit(frame_bgr)
+                # GUI가 이전 결과를 아직 처리하지 못했으면 이번 프레임은 건너뜀 (이벤트 큐에 지연이 쌓이지 않게)
+                if not self._result_pending.is_set():
+                    request = self.picam2.capture_request()
+                    try:
+                        # DMA 버퍼를 복사 없이 매핑한 채로 분석/프리뷰 축소까지 끝내고 바로 반환
+                        # BGR888 포맷은 numpy 배열이 [R, G, B] 순서라 변환 없이 그대로 사용
+                        with MappedArray(request, "main") as m:
+                            frame_rgb = m.array
+                            result = self.analyze_frame(frame_rgb, self.render_preview)
+                            if self.want_full_frame:
+                                # 이미지 저장이 필요할 때만 원본 전체를 복사
+                                result["frame_rgb"] = frame_rgb.copy()
+                                self.want_full_frame = False
+                    finally:
+                        request.release()
+
+                    self._result_pending.set()
+                    self.frame_ready.emit(result)
 
                 elapsed_ms = (time.perf_counter() - t0) * 1000.0
                 sleep_ms = self.interval_ms - elapsed_ms
@@ -431,6 +601,9 @@ class CameraWorker(QThread):
                 except Exception:
                     pass
 
+    def result_consumed(self):
+        self._result_pending.clear()
+
     def stop(self):
         self._running = False
         self.wait(3000)
@@ -450,6 +623,8 @@ class SaveWorker(QThread):
         self.images_dir = None
         self.image_count = 0
         self.data_log_count = 0
+        self._last_csv_sync = 0.0
+        self._unsynced_images = []
 
     def enqueue(self, item):
         try:
@@ -489,10 +664,15 @@ class SaveWorker(QThread):
 
         session_dir.mkdir(parents=True, exist_ok=True)
         self.images_dir = session_dir / "images"
-        self.csv_file = open(csv_path, "w", newline="", encoding="utf-8", buffering=1)
+        # 이미지 폴더는 세션 시작 때 한 번만 만듦 (저장할 때마다 mkdir 하지 않음)
+        if SAVE_IMAGE:
+            self.images_dir.mkdir(exist_ok=True)
+        # 버퍼를 넉넉히 잡아 실제 쓰기는 CSV_SYNC_SEC마다의 flush 때만 일어나게 함
+        self.csv_file = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
         self.csv_writer = csv.writer(self.csv_file)
         self.csv_writer.writerow(header)
         self.csv_file.flush()
+        self._last_csv_sync = time.monotonic()
         self.image_count = 0
         self.data_log_count = 0
         self.counts_updated.emit(self.image_count, self.data_log_count)
@@ -501,17 +681,23 @@ class SaveWorker(QThread):
     def _save_image(self, item):
         if self.images_dir is None:
             return
-        self.images_dir.mkdir(parents=True, exist_ok=True)
-        frame_bgr = item["frame_bgr"]
+        frame_rgb = item["frame_rgb"]
         t_ms_img = item["t_ms_img"]
         img_path = self.images_dir / f"{t_ms_img}.{IMAGE_EXT}"
 
-        if IMAGE_EXT.lower() in ["jpg", "jpeg"]:
-            ok = cv2.imwrite(str(img_path), frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), JPG_QUALITY])
+        if IMAGE_IS_JPEG:
+            # Picamera2의 JpegEncoder와 같은 simplejpeg(libjpeg-turbo)로 RGB를 바로 인코딩
+            # (simplejpeg 기본값 4:4:4 대신 imwrite/JpegEncoder와 같은 4:2:0으로 파일 크기 유지)
+            jpeg = simplejpeg.encode_jpeg(
+                np.ascontiguousarray(frame_rgb), quality=JPG_QUALITY, colorspace="RGB", colorsubsampling="420"
+            )
+            write_bytes_fd(img_path, jpeg)
+            ok = True
         else:
-            ok = cv2.imwrite(str(img_path), frame_bgr)
+            ok = cv2.imwrite(str(img_path), swap_rb_channels(frame_rgb))
 
         if ok:
+            self._unsynced_images.append(img_path)
             self.image_count += 1
             self.counts_updated.emit(self.image_count, self.data_log_count)
 
@@ -520,12 +706,26 @@ class SaveWorker(QThread):
             return
         row = item["row"]
         self.csv_writer.writerow(row)
-        if self.csv_file is not None:
-            self.csv_file.flush()
+        # 행은 이미 기록됐으므로 동기화 실패와 상관없이 화면 카운트를 CSV와 맞춤
         self.data_log_count += 1
         self.counts_updated.emit(self.image_count, self.data_log_count)
+        now_t = time.monotonic()
+        if now_t - self._last_csv_sync >= CSV_SYNC_SEC - CSV_SYNC_SLACK_SEC:
+            # CSV 행이 가리키는 이미지가 먼저 디스크에 있도록 이미지부터 내림
+            # (일부 이미지 동기화가 실패해도 알리기만 하고 CSV 동기화는 계속)
+            try:
+                sync_files(self._unsynced_images)
+            except OSError as e:
+                self.save_error.emit(f"이미지 동기화 실패: {e}")
+            self.csv_file.flush()
+            os.fsync(self.csv_file.fileno())
+            self._last_csv_sync = now_t
 
     def _close_session(self):
+        try:
+            sync_files(self._unsynced_images)
+        except Exception:
+            pass
         if self.csv_file:
             try:
                 self.csv_file.flush()
@@ -552,10 +752,10 @@ class RGBPlotWidget(QFrame):
         self.setObjectName("PlotPanel")
         self.title = title
 
-        self.x = deque(maxlen=PLOT_MAX_POINTS)
-        self.r = deque(maxlen=PLOT_MAX_POINTS)
-        self.g = deque(maxlen=PLOT_MAX_POINTS)
-        self.b = deque(maxlen=PLOT_MAX_POINTS)
+        # 최근 PLOT_MAX_POINTS개의 (R, G, B)를 담는 고정 크기 링 버퍼
+        self._buf = np.zeros((PLOT_MAX_POINTS, 3), dtype=np.float32)
+        self._pos = 0
+        self._count = 0
 
         self._bg = QColor("#0b1220")
         self._grid = QColor("#334155")
@@ -564,37 +764,59 @@ class RGBPlotWidget(QFrame):
         self._pen_r = QPen(QColor(239, 68, 68), 2)
         self._pen_g = QPen(QColor(34, 197, 94), 2)
         self._pen_b = QPen(QColor(59, 130, 246), 2)
+        self._dirty = False
+        # 채널별 선은 QPainterPath로 만들어 두고 데이터/크기가 바뀔 때만 다시 만듦
+        self._paths = None
+        self._paths_size = None
+        self._bg_pixmap = None
 
     def reset(self):
-        self.x.clear()
-        self.r.clear()
-        self.g.clear()
-        self.b.clear()
-        self.update()
-
-    def append(self, x_idx: int, rgb_tuple):
-        rr, gg, bb = rgb_tuple
-        self.x.append(x_idx)
-        self.r.append(rr)
-        self.g.append(gg)
-        self.b.append(bb)
+        self._pos = 0
+        self._count = 0
+        self._paths = None
         self.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self)
+    def append(self, rgb_tuple):
+        self._buf[self._pos] = rgb_tuple
+        self._pos = (self._pos + 1) % PLOT_MAX_POINTS
+        self._count = min(self._count + 1, PLOT_MAX_POINTS)
+        self._paths = None
+        # 다시 그리기는 refresh()가 UI 갱신 주기에 맞춰 한 번만 요청
+        self._dirty = True
+
+    def refresh(self):
+        if self._dirty:
+            self._dirty = False
+            self.update()
+
+    def _ordered_values(self):
+        if self._count < PLOT_MAX_POINTS:
+            return self._buf[:self._count]
+        return np.concatenate((self._buf[self._pos:], self._buf[:self._pos]))
+
+    def _build_paths(self, left, top, plot_w, plot_h):
+        vals = self._ordered_values()
+        n = len(vals)
+
+        # 모든 점의 픽셀 좌표를 NumPy로 한 번에 계산
+        xs = (left + (plot_w * np.arange(n) / (n - 1)).astype(np.int32)).tolist()
+        ys = top + (plot_h * (1.0 - np.clip(vals, 0, 255) / 255.0)).astype(np.int32)
+
+        def build_path(col):
+            path = QPainterPath()
+            path.moveTo(xs[0], col[0])
+            for x, y in zip(xs[1:], col[1:]):
+                path.lineTo(x, y)
+            return path
+
+        return tuple(build_path(ys[:, c].tolist()) for c in range(3))
+
+    def _render_background(self, w, h, left, top, plot_w, plot_h):
+        # 배경/제목/눈금/범례는 크기가 바뀔 때만 QPixmap에 한 번 그려 둠
+        pix = QPixmap(w, h)
+        pix.fill(self._bg)
+        p = QPainter(pix)
         p.setRenderHint(QPainter.Antialiasing, True)
-        p.fillRect(self.rect(), self._bg)
-
-        w = self.width()
-        h = self.height()
-
-        left = 46
-        right = 14
-        top = 36
-        bottom = 28
-
-        plot_w = max(1, w - left - right)
-        plot_h = max(1, h - top - bottom)
 
         p.setPen(self._text)
         f = QFont()
@@ -617,43 +839,51 @@ class RGBPlotWidget(QFrame):
             y = top + int(plot_h * i / 4)
             p.drawText(8, y + 4, f"{val:3d}")
 
-        if len(self.x) < 2:
-            p.end()
-            return
+        legend_x = left + plot_w - 110
+        legend_y = 18
+        p.setPen(self._pen_r)
+        p.drawText(legend_x, legend_y, "R")
+        p.setPen(self._pen_g)
+        p.drawText(legend_x + 22, legend_y, "G")
+        p.setPen(self._pen_b)
+        p.drawText(legend_x + 44, legend_y, "B")
+        p.end()
+        return pix
 
-        n = len(self.x)
+    def paintEvent(self, event):
+        w = self.width()
+        h = self.height()
 
-        def x_to_px(i):
-            return left + int(plot_w * i / (n - 1))
+        left = 46
+        right = 14
+        top = 36
+        bottom = 28
 
-        def y_to_px(v):
-            v = max(0, min(255, v))
-            return top + int(plot_h * (1.0 - (v / 255.0)))
+        plot_w = max(1, w - left - right)
+        plot_h = max(1, h - top - bottom)
 
-        def draw_line(vals, pen):
-            p.setPen(pen)
-            prev_x = x_to_px(0)
-            prev_y = y_to_px(vals[0])
-            for i in range(1, n):
-                cx = x_to_px(i)
-                cy = y_to_px(vals[i])
-                p.drawLine(prev_x, prev_y, cx, cy)
-                prev_x = cx
-                prev_y = cy
+        if self._bg_pixmap is None or self._bg_pixmap.size() != self.size():
+            self._bg_pixmap = self._render_background(w, h, left, top, plot_w, plot_h)
 
-        draw_line(list(self.r), self._pen_r)
-        draw_line(list(self.g), self._pen_g)
-        draw_line(list(self.b), self._pen_b)
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._bg_pixmap)
 
-        p.setFont(f2)
-        legend_x = left + plot_w - 110
-        legend_y = 18
+        if self._count < 2:
+            p.end()
+            return
+
+        if self._paths is None or self._paths_size != (w, h):
+            self._paths = self._build_paths(left, top, plot_w, plot_h)
+            self._paths_size = (w, h)
+
+        p.setRenderHint(QPainter.Antialiasing, True)
+        path_r, path_g, path_b = self._paths
         p.setPen(self._pen_r)
-        p.drawText(legend_x, legend_y, "R")
+        p.drawPath(path_r)
         p.setPen(self._pen_g)
-        p.drawText(legend_x + 22, legend_y, "G")
+        p.drawPath(path_g)
         p.setPen(self._pen_b)
-        p.drawText(legend_x + 44, legend_y, "B")
+        p.drawPath(path_b)
         p.end()
 
 
@@ -672,6 +902,25 @@ class RGBApplianceGUI(QWidget):
 
         # 새 ROI 안에 99포인트를 다시 균등 배치
         self.grid_points = generate_grid_points_from_roi(*self.roi, GRID_ROWS, GRID_COLS)
+        self._grid_xs, self._grid_ys = point_coord_arrays(self.grid_points)
+
+        # ROI/그리드는 고정이므로 오버레이는 프리뷰 크기로 한 번만 그려두고
+        # 매 프레임 축소된 프리뷰 위에 해당 픽셀만 덮어씀 (원본 프레임 복사 없음)
+        preview_scale, preview_w, preview_h = preview_geometry(WIDTH, HEIGHT, PREVIEW_MAX_W)
+        self._overlay_idx, self._overlay_vals = build_overlay_sprite(
+            scale_roi(self.roi, preview_scale),
+            scale_points(self.grid_points, preview_scale) if SHOW_GRID_POINTS_ON_PREVIEW else None,
+            preview_w, preview_h,
+        )
+
+        # 프리뷰 버퍼와 이를 감싸는 QImage는 두 벌만 만들고 CameraWorker 스레드에서 번갈아 제자리 갱신
+        # (결과는 한 번에 하나만 전달되므로 GUI가 읽는 동안 워커는 항상 다른 버퍼에 씀)
+        self._preview_bufs = [np.empty((preview_h, preview_w, 3), dtype=np.uint8) for _ in range(2)]
+        self._preview_qimgs = [
+            QImage(buf.data, preview_w, preview_h, preview_w * 3, QImage.Format_RGB888)
+            for buf in self._preview_bufs
+        ]
+        self._preview_idx = 0
 
         self.is_closing = False
         self.cleanup_done = False
@@ -682,13 +931,13 @@ class RGBApplianceGUI(QWidget):
         self.images_dir = None
         self.csv_path = None
         self.experiment_start_dt = None
-        self.sample_count = 0
+        self.experiment_start_mono = None
         self.image_count = 0
         self.data_log_count = 0
-        self.next_rgb_log_time = time.time()
-        self.next_img_log_time = time.time()
+        # 로깅 주기는 벽시계 변경(NTP 등)에 영향받지 않도록 monotonic 기준
+        self.next_rgb_log_time = time.monotonic()
+        self.next_img_log_time = time.monotonic()
 
-        self.latest_frame_bgr = None
         self.latest_roi_avg = None
         self.latest_grid_avg = ("", "", "")
         self.latest_top_avg = ("", "", "")
@@ -696,6 +945,7 @@ class RGBApplianceGUI(QWidget):
         self.latest_bottom_avg = ("", "", "")
         self.last_preview_qpixmap = None
         self.last_frame_ts = 0.0
+        self._shown_text = {}
 
         self.title_label = QLabel("AI NanoBio RGB Sensor")
         self.title_label.setObjectName("TitleLabel")
@@ -852,6 +1102,9 @@ class RGBApplianceGUI(QWidget):
         self._set_table_item(1, 1, "-", align=Qt.AlignCenter)
         self._set_table_item(1, 2, "-", align=Qt.AlignCenter)
         self._set_table_item(1, 3, "-", align=Qt.AlignCenter)
+        # 매번 table.item(row, col)로 찾지 않도록 R/G/B 셀 참조를 보관
+        self._roi_items = [self.table.item(0, c) for c in (1, 2, 3)]
+        self._grid_items = [self.table.item(1, c) for c in (1, 2, 3)]
 
         self.plot = RGBPlotWidget(title="ROI 평균 RGB 그래프")
 
@@ -898,11 +1151,14 @@ class RGBApplianceGUI(QWidget):
         self.setLayout(layout)
 
         self._last_disk_check = 0.0
+        self._data_root_str = str(DATA_ROOT)
         self.usb_mounts = []
         self.usb_mount = None
         self.copy_worker = None
         self.usb_removed_mode = False
         self.last_usb_signature = tuple()
+        self._usb_poll_sig = None
+        self._mount_watcher = UsbMountWatcher()
 
         self.save_worker = SaveWorker()
         self.save_worker.status.connect(self.on_save_status)
@@ -910,11 +1166,17 @@ class RGBApplianceGUI(QWidget):
         self.save_worker.save_error.connect(self.on_save_error)
         self.save_worker.start()
 
-        self.camera_worker = CameraWorker(WIDTH, HEIGHT, PREVIEW_INTERVAL_MS)
+        self.camera_worker = CameraWorker(WIDTH, HEIGHT, PREVIEW_INTERVAL_MS, self._analyze_frame)
         self.camera_worker.frame_ready.connect(self.on_new_frame)
         self.camera_worker.camera_error.connect(self.on_camera_error)
         self.camera_worker.start()
 
+        # 데이터 폴더는 시작할 때 한 번만 만들어 둠 (용량 확인 때마다 mkdir 하지 않음)
+        try:
+            DATA_ROOT.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+
         self._set_state_badge(False)
         self._update_counts_ui()
         self._update_button_states()
@@ -926,7 +1188,7 @@ class RGBApplianceGUI(QWidget):
         self.info_timer.start(INFO_INTERVAL_MS)
 
         self.usb_timer = QTimer(self)
-        self.usb_timer.timeout.connect(self.refresh_usb_ui)
+        self.usb_timer.timeout.connect(self._poll_usb_ui)
         self.usb_timer.start(USB_INTERVAL_MS)
 
         self.refresh_usb_ui()
@@ -1002,6 +1264,13 @@ class RGBApplianceGUI(QWidget):
         item.setTextAlignment(align)
         self.table.setItem(row, col, item)
 
+    def _set_text_cached(self, widget, text):
+        # 값이 그대로면 setText를 생략해 불필요한 relayout/repaint를 막음
+        if self._shown_text.get(id(widget)) == text:
+            return
+        self._shown_text[id(widget)] = text
+        widget.setText(text)
+
     def _set_state_badge(self, running: bool):
         if running:
             self.state_badge.setText('<span style="color:#ef4444;">●</span> 실험 중')
@@ -1023,22 +1292,25 @@ class RGBApplianceGUI(QWidget):
         self.btn_stop.setEnabled(self.running)
 
     def _update_disk_label(self, force=False):
-        now_t = time.time()
-        if (not force) and (now_t - self._last_disk_check < DISK_UPDATE_SEC):
+        now_t = time.monotonic()
+        # 실험 중에는 용량이 천천히 줄어드므로 더 드물게 확인
+        interval = DISK_UPDATE_RECORDING_SEC if self.running else DISK_UPDATE_SEC
+        if (not force) and (now_t - self._last_disk_check < interval):
             return
         self._last_disk_check = now_t
         try:
-            DATA_ROOT.mkdir(parents=True, exist_ok=True)
-            usage = shutil.disk_usage(str(DATA_ROOT.resolve()))
-            self.lab_disk.setText(f"남은 용량: {fmt_bytes(usage.free)} (총 {fmt_bytes(usage.total)})")
+            st = os.statvfs(self._data_root_str)
+            free = st.f_bavail * st.f_frsize
+            total = st.f_blocks * st.f_frsize
+            self._set_text_cached(self.lab_disk, f"남은 용량: {fmt_bytes(free)} (총 {fmt_bytes(total)})")
         except Exception:
-            self.lab_disk.setText("남은 용량: 확인 실패")
+            self._set_text_cached(self.lab_disk, "남은 용량: 확인 실패")
 
-    def _update_recent_sessions_ui(self):
-        recents = recent_sessions(DATA_ROOT, limit=3)
+    def _update_recent_sessions_ui(self, sessions):
+        recents = sessions[:3]
         for i in range(3):
             if i < len(recents):
-                self.recent_labels[i].setText(f"• {session_display_name(recents[i].name)}")
+                self.recent_labels[i].setText(f"• {session_display_name(recents[i])}")
             else:
                 self.recent_labels[i].setText("• -")
 
@@ -1050,32 +1322,50 @@ class RGBApplianceGUI(QWidget):
             self.usb_removed_mode = False
         self.last_usb_signature = current_sig
 
-    def on_new_frame(self, frame_bgr):
+    def _analyze_frame(self, frame_rgb, render_preview):
+        # CameraWorker 스레드에서 매핑된 버퍼를 잡은 채로 호출됨 - Qt 위젯은 건드리지 않음
+        grid_values, grid_avg, (top_avg, middle_avg, bottom_avg) = sample_grid_rgb(
+            frame_rgb, self._grid_xs, self._grid_ys, GRID_ROWS, GRID_COLS
+        )
+        result = {
+            "roi_avg": get_roi_mean_rgb(frame_rgb, self.roi),
+            "grid_values": grid_values,
+            "grid_avg": grid_avg,
+            "top_avg": top_avg,
+            "middle_avg": middle_avg,
+            "bottom_avg": bottom_avg,
+            "preview_qimg": None,
+        }
+
+        if render_preview:
+            buf = self._preview_bufs[self._preview_idx]
+            resize_for_preview(frame_rgb, PREVIEW_MAX_W, dst=buf)
+            buf[self._overlay_idx] = self._overlay_vals
+            # 복사 없이 그대로 넘기고 다음 프레임은 다른 버퍼에 그림
+            result["preview_qimg"] = self._preview_qimgs[self._preview_idx]
+            self._preview_idx ^= 1
+        return result
+
+    def on_new_frame(self, result):
+        self.camera_worker.result_consumed()
         if self.is_closing:
             return
 
         self.last_frame_ts = time.time()
-        self.latest_frame_bgr = frame_bgr
-        self.latest_roi_avg = get_roi_mean_rgb(frame_bgr, self.roi)
-        grid_samples, self.latest_grid_avg = sample_grid_rgb(frame_bgr, self.grid_points)
-        self.latest_top_avg, self.latest_middle_avg, self.latest_bottom_avg = split_grid_samples_top_middle_bottom(
-            grid_samples, GRID_ROWS, GRID_COLS
-        )
-
-        overlay = draw_roi_and_grid(
-            frame_bgr,
-            self.roi,
-            self.grid_points if SHOW_GRID_POINTS_ON_PREVIEW else None,
-        )
-        disp = resize_for_preview(overlay, PREVIEW_MAX_W)
-        disp_rgb = cv2.cvtColor(disp, cv2.COLOR_BGR2RGB)
-        h, w = disp_rgb.shape[:2]
-        qimg = QImage(disp_rgb.data, w, h, w * 3, QImage.Format_RGB888).copy()
-        self.last_preview_qpixmap = QPixmap.fromImage(qimg)
-        self.preview_label.setPixmap(self.last_preview_qpixmap)
+        self.latest_roi_avg = result["roi_avg"]
+        self.latest_grid_avg = result["grid_avg"]
+        self.latest_top_avg = result["top_avg"]
+        self.latest_middle_avg = result["middle_avg"]
+        self.latest_bottom_avg = result["bottom_avg"]
+
+        # 화면이 가려져 있으면 다음 프레임부터 프리뷰 렌더링은 건너뛰고 로깅만 수행
+        self.camera_worker.render_preview = self.isVisible() and not self.isMinimized()
+        if result["preview_qimg"] is not None:
+            self.last_preview_qpixmap = QPixmap.fromImage(result["preview_qimg"])
+            self.preview_label.setPixmap(self.last_preview_qpixmap)
 
         if self.running:
-            self._handle_logging(frame_bgr)
+            self._handle_logging(result)
 
     def on_camera_error(self, msg):
         self.status_pill.setText(f"ERROR  •  {msg}")
@@ -1092,11 +1382,30 @@ class RGBApplianceGUI(QWidget):
         self._update_counts_ui()
 
     # =================== USB ===================
+    def _usb_poll_signature(self, mounts):
+        try:
+            root_mtime = os.stat(self._data_root_str).st_mtime_ns
+        except OSError:
+            root_mtime = 0
+        copying = self.copy_worker is not None and self.copy_worker.isRunning()
+        return (tuple(mounts), root_mtime, self.usb_removed_mode, copying, self.session_combo.currentText())
+
+    def _poll_usb_ui(self):
+        # 주기 갱신은 USB 마운트/세션 폴더/선택 상태가 바뀌었을 때만 전체 UI를 다시 만듦
+        if self.is_closing:
+            return
+        mounts = self._mount_watcher.mounts() if not self.running else self.usb_mounts
+        if self._usb_poll_signature(mounts) == self._usb_poll_sig:
+            # 목록은 그대로 두고 저장/복사 상태 문구만 대기 상태로 되돌림 (예전처럼 주기마다 초기화)
+            self._update_usb_progress_text()
+            return
+        self.refresh_usb_ui()
+
     def refresh_usb_ui(self):
         if self.is_closing:
             return
 
-        mounts = find_usb_mounts() if not self.running else self.usb_mounts
+        mounts = self._mount_watcher.mounts() if not self.running else self.usb_mounts
         self._update_usb_state_transition(mounts)
         self.usb_mounts = mounts
         self.usb_mount = mounts[0] if mounts else None
@@ -1108,15 +1417,15 @@ class RGBApplianceGUI(QWidget):
         else:
             self.usb_status.setText("USB: 연결 안됨")
 
-        self._update_recent_sessions_ui()
-
+        # 세션 폴더는 한 번만 읽어 최근 내역과 콤보박스에 같이 사용
         sessions = list_sessions(DATA_ROOT)
+        self._update_recent_sessions_ui(sessions)
+
         current = self.session_combo.currentText() if self.session_combo.count() else ""
         self.session_combo.blockSignals(True)
         self.session_combo.clear()
-        for s in sessions:
-            self.session_combo.addItem(s.name)
-        if current and current in [s.name for s in sessions]:
+        self.session_combo.addItems(sessions)
+        if current and current in sessions:
             self.session_combo.setCurrentText(current)
         self.session_combo.blockSignals(False)
 
@@ -1129,6 +1438,10 @@ class RGBApplianceGUI(QWidget):
         self.btn_copy_usb.setEnabled(can_copy)
         self.btn_eject_usb.setEnabled(can_eject)
 
+        self._update_usb_progress_text()
+        self._usb_poll_sig = self._usb_poll_signature(mounts)
+
+    def _update_usb_progress_text(self):
         if self.usb_removed_mode:
             self.usb_progress.setText("안전 제거 완료 (USB를 분리해도 됨)")
         elif self.session_combo.count() == 0:
@@ -1340,18 +1653,18 @@ class RGBApplianceGUI(QWidget):
             return
 
         self.running = True
-        now_t = time.time()
+        now_t = time.monotonic()
         self.next_rgb_log_time = now_t
         self.next_img_log_time = now_t
         self.experiment_start_dt = datetime.now()
-        self.sample_count = 0
+        self.experiment_start_mono = now_t
         self.image_count = 0
         self.data_log_count = 0
         self._update_counts_ui()
 
         self.lab_state.setText("실험 상태: 실험중")
         self.lab_start.setText(f"실험 시작 시간: {self.experiment_start_dt.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.lab_elapsed.setText("실험 경과 시간: 00:00:00")
+        self._set_text_cached(self.lab_elapsed, "실험 경과 시간: 00:00:00")
         self.status_pill.setText(f"RECORDING  •  {sess}")
         self._set_state_badge(True)
         self._update_button_states()
@@ -1377,79 +1690,80 @@ class RGBApplianceGUI(QWidget):
             return
 
         self._update_disk_label()
-        if self.running and self.experiment_start_dt is not None:
-            elapsed = int((datetime.now() - self.experiment_start_dt).total_seconds())
-            self.lab_elapsed.setText(f"실험 경과 시간: {fmt_hms(elapsed)}")
+        if self.running and self.experiment_start_mono is not None:
+            # 경과 시간은 datetime 객체 없이 monotonic 차이로 계산 (시계 변경에도 안전)
+            elapsed = int(time.monotonic() - self.experiment_start_mono)
+            self._set_text_cached(self.lab_elapsed, f"실험 경과 시간: {fmt_hms(elapsed)}")
 
         roi_avg = self.latest_roi_avg
         grid_avg = self.latest_grid_avg
+        set_text = self._set_text_cached
 
         if roi_avg is None:
-            self.table.item(0, 1).setText("-")
-            self.table.item(0, 2).setText("-")
-            self.table.item(0, 3).setText("-")
-            self.lab_roi_avg.setText("ROI 평균 RGB: -")
+            for item in self._roi_items:
+                set_text(item, "-")
+            set_text(self.lab_roi_avg, "ROI 평균 RGB: -")
         else:
             r, g, b = roi_avg
-            self.table.item(0, 1).setText(str(r))
-            self.table.item(0, 2).setText(str(g))
-            self.table.item(0, 3).setText(str(b))
-            self.lab_roi_avg.setText(f"ROI 평균 RGB: R={r}, G={g}, B={b}")
+            for item, v in zip(self._roi_items, roi_avg):
+                set_text(item, str(v))
+            set_text(self.lab_roi_avg, f"ROI 평균 RGB: R={r}, G={g}, B={b}")
 
         gr, gg, gb = grid_avg
         if gr == "":
-            self.table.item(1, 1).setText("-")
-            self.table.item(1, 2).setText("-")
-            self.table.item(1, 3).setText("-")
-            self.lab_grid_avg.setText("99포인트 평균 RGB: -")
+            for item in self._grid_items:
+                set_text(item, "-")
+            set_text(self.lab_grid_avg, "99포인트 평균 RGB: -")
         else:
-            self.table.item(1, 1).setText(str(gr))
-            self.table.item(1, 2).setText(str(gg))
-            self.table.item(1, 3).setText(str(gb))
-            self.lab_grid_avg.setText(f"99포인트 평균 RGB: R={gr}, G={gg}, B={gb}")
+            for item, v in zip(self._grid_items, grid_avg):
+                set_text(item, str(v))
+            set_text(self.lab_grid_avg, f"99포인트 평균 RGB: R={gr}, G={gg}, B={gb}")
 
         def set_zone_label(label_widget, title, avg):
             zr, zg, zb = avg
             if zr == "":
-                label_widget.setText(f"{title}: -")
+                set_text(label_widget, f"{title}: -")
             else:
-                label_widget.setText(f"{title}: R={zr}, G={zg}, B={zb}")
+                set_text(label_widget, f"{title}: R={zr}, G={zg}, B={zb}")
 
         set_zone_label(self.lab_top_avg, "TOP 33포인트 평균 RGB", self.latest_top_avg)
         set_zone_label(self.lab_middle_avg, "MIDDLE 33포인트 평균 RGB", self.latest_middle_avg)
         set_zone_label(self.lab_bottom_avg, "BOTTOM 33포인트 평균 RGB", self.latest_bottom_avg)
+        self.plot.refresh()
 
-    def _handle_logging(self, frame_bgr):
-        now_t = time.time()
+    def _handle_logging(self, result):
+        now_t = time.monotonic()
+        wall_t = time.time()
 
         if SAVE_IMAGE and now_t >= self.next_img_log_time:
-            ok = self.save_worker.enqueue({
-                "cmd": "save_image",
-                "frame_bgr": frame_bgr.copy(),
-                "t_ms_img": now_ms(),
-            })
-            if not ok:
-                self.status_pill.setText("WARN  •  이미지 저장 큐 가득 참")
-            self.next_img_log_time = now_t + IMAGE_LOG_INTERVAL_SEC
+            frame_rgb = result.get("frame_rgb")
+            if frame_rgb is None:
+                # 원본 프레임은 매핑 해제 전에 복사해야 하므로 다음 프레임에서 복사본을 받아 저장
+                self.camera_worker.want_full_frame = True
+            else:
+                ok = self.save_worker.enqueue({
+                    "cmd": "save_image",
+                    "frame_rgb": frame_rgb,
+                    "t_ms_img": to_ms(wall_t),
+                })
+                if not ok:
+                    self.status_pill.setText("WARN  •  이미지 저장 큐 가득 참")
+                self.next_img_log_time = now_t + IMAGE_LOG_INTERVAL_SEC
 
         if now_t >= self.next_rgb_log_time:
-            timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+            timestamp_str = datetime.fromtimestamp(wall_t).strftime("%Y-%m-%d %H:%M")
             left, top, right, bottom = self.roi
-            roi_avg = self.latest_roi_avg
-            grid_samples, grid_avg = sample_grid_rgb(frame_bgr, self.grid_points)
+            roi_avg = result["roi_avg"]
 
             if roi_avg is None:
                 roi_r, roi_g, roi_b = "", "", ""
             else:
                 roi_r, roi_g, roi_b = roi_avg
 
-            grid_r, grid_g, grid_b = grid_avg
-            top_avg, middle_avg, bottom_avg = split_grid_samples_top_middle_bottom(
-                grid_samples, GRID_ROWS, GRID_COLS
-            )
-            top_r, top_g, top_b = top_avg
-            middle_r, middle_g, middle_b = middle_avg
-            bottom_r, bottom_g, bottom_b = bottom_avg
+            grid_r, grid_g, grid_b = result["grid_avg"]
+            top_r, top_g, top_b = result["top_avg"]
+            middle_r, middle_g, middle_b = result["middle_avg"]
+            bottom_r, bottom_g, bottom_b = result["bottom_avg"]
 
             row = [
                 timestamp_str,
@@ -1460,16 +1774,14 @@ class RGBApplianceGUI(QWidget):
                 middle_r, middle_g, middle_b,
                 bottom_r, bottom_g, bottom_b,
             ]
-            for pid, x, y, r, g, b in grid_samples:
-                row.extend([x, y, r, g, b])
+            row.extend(result["grid_values"])
 
             ok = self.save_worker.enqueue({"cmd": "write_row", "row": row})
             if not ok:
                 self.status_pill.setText("WARN  •  CSV 저장 큐 가득 참")
             else:
                 if roi_avg is not None:
-                    self.sample_count += 1
-                    self.plot.append(self.sample_count, roi_avg)
+                    self.plot.append(roi_avg)
             self.next_rgb_log_time = now_t + RGB_LOG_INTERVAL_SEC
 
     def _cleanup_runtime(self):
@@ -1485,6 +1797,7 @@ class RGBApplianceGUI(QWidget):
             pass
         try:
             self.usb_timer.stop()
+            self._mount_watcher.close()
         except Exception:
             pass
 
@@ -1499,7 +1812,6 @@ class RGBApplianceGUI(QWidget):
         try:
             self.preview_label.clear()
             self.last_preview_qpixmap = None
-            self.latest_frame_bgr = None
         except Exception:
             pass
 
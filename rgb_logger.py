@@ -1,10 +1,24 @@
 import csv
+import os
+import queue
+import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
+# 작은 프레임 연산에서 OpenMP 스레드 동기화 비용이 더 크므로 단일 스레드로 고정 (cv2 import 전에 설정)
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import cv2
-from picamera2 import Picamera2
+import numpy as np
+import simplejpeg
+from libcamera import ColorSpace
+from picamera2 import MappedArray, Picamera2
+
+from rgb_core import FRAME_RECORD, session_stamp, sync_files, write_bytes_fd
+
+cv2.setNumThreads(1)
 
 print("1")
 
@@ -18,6 +32,7 @@ LOG_INTERVAL_SEC = 1.0
 # 프리뷰
 SHOW_PREVIEW = True
 PREVIEW_MAX_W = 960   # 더 가볍게: 640
+PREVIEW_INTERVAL_SEC = 1 / 15   # 프리뷰는 15fps면 충분 (저장 주기와 별개)
 
 # 5포인트
 POINTS = [
@@ -28,56 +43,172 @@ POINTS = [
     ("pc", 640, 360),
 ]
 
+# ✅ 프리뷰는 lores 스트림(YUV420)으로 받음 - 폭을 64 배수로 맞춰야 stride 패딩이 없음
+LORES_W = PREVIEW_MAX_W // 64 * 64
+LORES_H = LORES_W * HEIGHT // WIDTH // 2 * 2
+
+# ✅ 단일 픽셀 대신 포인트 주변 (2k+1)x(2k+1) 창 평균 (센서 노이즈 완화)
+POINT_WINDOW_K = 3
+
+PT_XS = np.array([x for _, x, _ in POINTS], dtype=np.intp)
+PT_YS = np.array([y for _, _, y in POINTS], dtype=np.intp)
+PT_VALID = ((PT_XS >= 0) & (PT_XS < WIDTH) & (PT_YS >= 0) & (PT_YS < HEIGHT)).tolist()
+PT_WINDOWS = [
+    (slice(max(0, y - POINT_WINDOW_K), min(HEIGHT, y + POINT_WINDOW_K + 1)),
+     slice(max(0, x - POINT_WINDOW_K), min(WIDTH, x + POINT_WINDOW_K + 1)))
+    for _, x, y in POINTS
+]
+# main은 YUV420이라 U/V 평면은 가로세로 절반 해상도 - 같은 창을 절반 좌표로
+PT_CHROMA_WINDOWS = [
+    (slice(sy.start // 2, (sy.stop + 1) // 2), slice(sx.start // 2, (sx.stop + 1) // 2))
+    for sy, sx in PT_WINDOWS
+]
+PREVIEW_POINTS = [(pid, x * LORES_W // WIDTH, y * LORES_H // HEIGHT) for pid, x, y in POINTS]
+
 # 이미지 저장
 SAVE_IMAGE = True
 IMAGE_EXT = "jpg"
 JPG_QUALITY = 90
+IMAGE_IS_JPEG = IMAGE_EXT.lower() in ("jpg", "jpeg")
 SAVE_EVERY_N = 1
+# ✅ 이미지를 개별 파일 대신 세션당 frames.bin 하나에 이어붙여 저장 (extract_frames.py로 추출)
+SAVE_IMAGE_BLOB = True
+BLOB_NAME = "frames.bin"
+
+# ✅ 인코딩/디스크 기록은 별도 스레드에서 (큐가 가득 차면 해당 샘플은 건너뜀)
+SAVE_QUEUE_MAX = 4
+# CSV는 샘플마다 flush하지 않고 이 간격마다 flush + fsync (전원 차단 시 손실 상한)
+CSV_SYNC_SEC = 5.0
+# 종료 시 저장 스레드를 기다리는 최대 시간 (멈춘 스레드 때문에 종료가 막히지 않게)
+SAVER_JOIN_SEC = 10.0
 
 BASE_DIR = Path("data")
 
 
 # ================== 유틸 ==================
-def ts_now_iso():
-    return datetime.now().isoformat(timespec="milliseconds")
-
-def ts_now_ms():
-    return int(time.time() * 1000)
-
-def session_stamp():
-    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-def safe_get_rgb_from_bgr(frame_bgr, x, y):
-    h, w = frame_bgr.shape[:2]
-    if not (0 <= x < w and 0 <= y < h):
-        return None
-    b, g, r = frame_bgr[y, x]
-    return int(r), int(g), int(b)
+def ts_iso(t):
+    return datetime.fromtimestamp(t).isoformat(timespec="milliseconds")
+
+def ts_ms(t):
+    return int(t * 1000)
+
+def yuv420_planes(frame_yuv):
+    # Picamera2 JpegEncoder와 같은 방식으로 stride를 고려해 Y/U/V 평면을 잘라냄 (복사 없음)
+    Y = frame_yuv[:HEIGHT, :WIDTH]
+    reshaped = frame_yuv.reshape((frame_yuv.shape[0] * 2, frame_yuv.strides[0] // 2))
+    U = reshaped[2 * HEIGHT: 2 * HEIGHT + HEIGHT // 2, :WIDTH // 2]
+    V = reshaped[2 * HEIGHT + HEIGHT // 2:, :WIDTH // 2]
+    return Y, U, V
+
+def yuv_to_rgb(y, u, v):
+    # JPEG(sYCC, full range BT.601) 변환식 - 창 평균에 적용 (선형이라 픽셀별 변환 후 평균과 같음)
+    u -= 128.0
+    v -= 128.0
+    r = y + 1.402 * v
+    g = y - 0.344136 * u - 0.714136 * v
+    b = y + 1.772 * u
+    return min(max(r, 0.0), 255.0), min(max(g, 0.0), 255.0), min(max(b, 0.0), 255.0)
 
 def draw_points_overlay(frame_bgr, points):
-    out = frame_bgr.copy()
+    # 넘겨받은 버퍼에 바로 그림 (복사 없음)
     for pid, x, y in points:
-        cv2.circle(out, (x, y), 5, (0, 255, 0), -1)
-        cv2.putText(out, pid, (x + 8, y - 8),
+        cv2.circle(frame_bgr, (x, y), 5, (0, 255, 0), -1)
+        cv2.putText(frame_bgr, pid, (x + 8, y - 8),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2, cv2.LINE_AA)
-    return out
-
-def resize_for_preview(frame_bgr, max_w):
-    h, w = frame_bgr.shape[:2]
-    if w <= max_w:
-        return frame_bgr
-    scale = max_w / w
-    return cv2.resize(frame_bgr, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-
-def save_frame(image_dir: Path, frame_bgr, fname_stem: str):
-    image_dir.mkdir(parents=True, exist_ok=True)
+    return frame_bgr
+
+def build_overlay_sprite(points, width, height):
+    # 포인트는 고정이므로 빈 캔버스에 한 번만 그려두고 칠해진 픽셀 좌표/색만 보관
+    canvas = draw_points_overlay(np.zeros((height, width, 3), dtype=np.uint8), points)
+    ys, xs = np.nonzero(canvas.any(axis=2))
+    return (ys, xs), canvas[ys, xs]
+
+def encode_frame(frame_yuv):
+    if IMAGE_IS_JPEG:
+        # Picamera2의 JpegEncoder와 같은 simplejpeg(libjpeg-turbo)로 YUV 평면을 색변환 없이 바로 인코딩
+        return simplejpeg.encode_jpeg_yuv_planes(*yuv420_planes(frame_yuv), quality=JPG_QUALITY)
+    # cvtColor는 패딩 없는 I420만 받으므로 stride를 뺀 Y/U/V 평면을 이어붙여 연속 버퍼로 만듦
+    plane_y, plane_u, plane_v = yuv420_planes(frame_yuv)
+    i420 = np.concatenate((plane_y.ravel(), plane_u.ravel(), plane_v.ravel())).reshape(HEIGHT * 3 // 2, WIDTH)
+    frame_bgr = cv2.cvtColor(i420, cv2.COLOR_YUV420p2BGR)
+    ok, buf = cv2.imencode(f".{IMAGE_EXT}", frame_bgr)
+    return buf if ok else None
+
+def save_frame(image_dir: Path, frame_yuv, fname_stem: str):
     out_path = image_dir / f"{fname_stem}.{IMAGE_EXT}"
-    if IMAGE_EXT.lower() in ["jpg", "jpeg"]:
-        cv2.imwrite(str(out_path), frame_bgr, [int(cv2.IMWRITE_JPEG_QUALITY), JPG_QUALITY])
-    else:
-        cv2.imwrite(str(out_path), frame_bgr)
+    # 메모리에서 인코딩한 뒤 fd 하나로 바로 기록 (imwrite의 파일 열기/버퍼링 경로 생략)
+    buf = encode_frame(frame_yuv)
+    if buf is None:
+        return ""
+    write_bytes_fd(out_path, buf)
     return str(out_path)
 
+def append_frame(blob, frame_yuv, t_ms: int):
+    buf = encode_frame(frame_yuv)
+    if buf is None:
+        return ""
+    offset = blob.tell()
+    blob.write(FRAME_RECORD.pack(t_ms, len(buf)))
+    blob.write(buf)
+    return f"{BLOB_NAME}@{offset}"
+
+def storage_loop(save_q, f, writer, blob, images_dir: Path, save_errors):
+    last_sync = time.monotonic()
+    unsynced_images = []
+    while True:
+        item = save_q.get()
+        if item is None:
+            # 마지막 주기 이후 기록한 이미지 파일도 종료 전에 내림 (CSV는 main에서 닫으며 동기화)
+            try:
+                sync_files(unsynced_images)
+            except Exception as e:
+                save_errors.append(e)
+                print(f"[ERROR] 이미지 동기화 실패: {e}")
+            return
+        frame_yuv, t_ms, fname_stem, rows = item
+
+        # 인코딩/기록 오류(예: SD 카드 가득 참)는 메인 루프에 알리고 스레드 종료 -> 메인이 기록을 중단
+        try:
+            img_path_str = ""
+            if frame_yuv is not None:
+                if blob is not None:
+                    img_path_str = append_frame(blob, frame_yuv, t_ms)
+                else:
+                    img_path_str = save_frame(images_dir, frame_yuv, fname_stem)
+                    if img_path_str:
+                        unsynced_images.append(img_path_str)
+
+            for row in rows:
+                row[2] = img_path_str
+            writer.writerows(rows)
+
+            now = time.monotonic()
+            if now - last_sync >= CSV_SYNC_SEC:
+                # CSV가 가리키는 frames.bin@offset 레코드/이미지 파일이 먼저 디스크에 있어야 하므로 그것부터 내림
+                sync_files(unsynced_images)
+                if blob is not None:
+                    blob.flush()
+                    os.fsync(blob.fileno())
+                f.flush()
+                os.fsync(f.fileno())
+                last_sync = now
+        except Exception as e:
+            save_errors.append(e)
+            print(f"[ERROR] 저장 실패 ({ts_iso(t_ms / 1000)}): {e}")
+            return
+
+def sync_and_close(fh):
+    # 종료 시 남은 버퍼를 디스크까지 내리고 닫음 (실패해도 나머지 정리는 계속)
+    try:
+        fh.flush()
+        os.fsync(fh.fileno())
+    except OSError as e:
+        print(f"[ERROR] {fh.name} 동기화 실패: {e}")
+    try:
+        fh.close()
+    except OSError:
+        pass
+
 
 # ================== 메인 ==================
 def main():
@@ -85,67 +216,136 @@ def main():
     session_dir = BASE_DIR / sess
     images_dir = session_dir / "images"
     session_dir.mkdir(parents=True, exist_ok=True)
+    # 개별 이미지 파일로 저장할 때만 폴더를 세션 시작 시 한 번 만듦
+    if SAVE_IMAGE and not SAVE_IMAGE_BLOB:
+        images_dir.mkdir(exist_ok=True)
 
     csv_path = session_dir / f"rgb_points_{sess}.csv"
+    blob_path = session_dir / BLOB_NAME
 
     picam2 = Picamera2()
     config = picam2.create_video_configuration(
-        main={"size": (WIDTH, HEIGHT), "format": "RGB888"}
+        # ✅ main도 ISP 기본 포맷인 YUV420 (RGB888 대비 절반 크기) - JPEG와 같은 sYCC 색공간 고정
+        main={"size": (WIDTH, HEIGHT), "format": "YUV420"},
+        # 프리뷰를 띄우지 않으면 lores 스트림 자체를 만들지 않음 (ISP가 두 번째 출력을 생성하지 않게)
+        lores={"size": (LORES_W, LORES_H), "format": "YUV420"} if SHOW_PREVIEW else None,
+        colour_space=ColorSpace.Sycc(),
+        buffer_count=4,
     )
     picam2.configure(config)
     picam2.start()
 
-    f = open(csv_path, "w", newline="", encoding="utf-8")
+    # 버퍼를 넉넉히 잡아 실제 쓰기는 CSV_SYNC_SEC마다의 flush 때만 일어나게 함
+    f = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
     writer = csv.writer(f)
     writer.writerow(["timestamp_iso", "unix_ms", "image_path", "point_id", "x", "y", "R", "G", "B"])
 
+    blob = None
+    if SAVE_IMAGE and SAVE_IMAGE_BLOB:
+        blob = open(blob_path, "wb", buffering=1 << 20)
+
+    save_q = queue.Queue(maxsize=SAVE_QUEUE_MAX)
+    save_errors = []
+    saver = threading.Thread(target=storage_loop, args=(save_q, f, writer, blob, images_dir, save_errors), daemon=True)
+    saver.start()
+
+    if SHOW_PREVIEW:
+        overlay_idx, overlay_vals = build_overlay_sprite(PREVIEW_POINTS, LORES_W, LORES_H)
+
     sample_idx = 0
-    next_log_time = time.time()  # ✅ 저장 타이머
+    next_log_time = time.monotonic()  # ✅ 저장 타이머 (벽시계 변경에 영향받지 않도록 monotonic)
+    next_preview_time = next_log_time
 
     try:
         while True:
-            # 프리뷰는 가능한 자주 갱신
-            frame_rgb = picam2.capture_array()
-            frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-
-            if SHOW_PREVIEW:
-                preview = draw_points_overlay(frame_bgr, POINTS)
-                preview = resize_for_preview(preview, PREVIEW_MAX_W)
+            # 저장 스레드가 죽었으면 샘플을 계속 버리지 말고 바로 중단
+            if save_errors:
+                break
+
+            # 프리뷰는 PREVIEW_INTERVAL_SEC마다만 갱신 (작은 lores 프레임만 변환)
+            if SHOW_PREVIEW and time.monotonic() >= next_preview_time:
+                next_preview_time = time.monotonic() + PREVIEW_INTERVAL_SEC
+                preview = cv2.cvtColor(picam2.capture_array("lores"), cv2.COLOR_YUV420p2BGR)
+                preview[overlay_idx] = overlay_vals
                 cv2.imshow("RGB Sensor Preview (press q to quit)", preview)
                 if cv2.waitKey(1) & 0xFF == ord("q"):
                     break
 
-            # ✅ 저장은 LOG_INTERVAL_SEC마다만 수행
-            now = time.time()
+            # ✅ 저장은 LOG_INTERVAL_SEC마다만 수행 (이때만 full-res main 프레임을 가져옴)
+            now = time.monotonic()
             if now >= next_log_time:
                 sample_idx += 1
-                t_iso = ts_now_iso()
-                t_ms = ts_now_ms()
+                save_img = SAVE_IMAGE and (sample_idx % SAVE_EVERY_N == 0)
+                # 시각은 한 번만 읽고 ISO/ms 모두 같은 값에서 만듦
+                t = time.time()
+                t_iso = ts_iso(t)
+                t_ms = ts_ms(t)
                 fname_stem = f"{sess}_{t_ms}"
 
-                img_path_str = ""
-                if SAVE_IMAGE and (sample_idx % SAVE_EVERY_N == 0):
-                    img_path_str = save_frame(images_dir, frame_bgr, fname_stem)
+                # DMA 버퍼를 복사 없이 매핑한 채로 포인트 창의 Y/U/V 평균만 RGB로 바꿈
+                # (이미지를 저장하는 샘플만 저장 스레드로 넘길 전체 프레임을 복사)
+                rows = []
+                frame_yuv = None
+                request = picam2.capture_request()
+                try:
+                    with MappedArray(request, "main") as m:
+                        plane_y, plane_u, plane_v = yuv420_planes(m.array)
+                        # image_path(세 번째 칸)는 저장 스레드가 이미지를 기록한 뒤 채움
+                        for (pid, x, y), valid, (sy, sx), (cy, cx) in zip(POINTS, PT_VALID, PT_WINDOWS, PT_CHROMA_WINDOWS):
+                            if not valid:
+                                rows.append([t_iso, t_ms, "", pid, x, y, "", "", ""])
+                            else:
+                                r, g, b = yuv_to_rgb(
+                                    cv2.mean(plane_y[sy, sx])[0],
+                                    cv2.mean(plane_u[cy, cx])[0],
+                                    cv2.mean(plane_v[cy, cx])[0],
+                                )
+                                rows.append([t_iso, t_ms, "", pid, x, y, round(r, 1), round(g, 1), round(b, 1)])
+                        if save_img:
+                            frame_yuv = m.array.copy()
+                finally:
+                    request.release()
+
+                try:
+                    save_q.put_nowait((frame_yuv, t_ms, fname_stem, rows))
+                except queue.Full:
+                    print(f"[WARN] 저장 큐 가득 참 - 샘플 건너뜀 ({t_iso})")
 
-                for pid, x, y in POINTS:
-                    rgb = safe_get_rgb_from_bgr(frame_bgr, x, y)
-                    if rgb is None:
-                        writer.writerow([t_iso, t_ms, img_path_str, pid, x, y, "", "", ""])
-                    else:
-                        r, g, b = rgb
-                        writer.writerow([t_iso, t_ms, img_path_str, pid, x, y, r, g, b])
-
-                f.flush()
                 next_log_time = now + LOG_INTERVAL_SEC
+            else:
+                # 다음 프리뷰/저장 시각까지 대기 (바쁜 루프 방지)
+                wake = min(next_log_time, next_preview_time) if SHOW_PREVIEW else next_log_time
+                if wake > now:
+                    time.sleep(wake - now)
 
     finally:
-        f.close()
+        # 오류로 이미 끝난 스레드면 가득 찬 큐에 종료 신호를 넣으려고 기다리지 않음
+        if saver.is_alive():
+            try:
+                save_q.put(None, timeout=SAVER_JOIN_SEC)
+            except queue.Full:
+                pass
+            saver.join(timeout=SAVER_JOIN_SEC)
+        if saver.is_alive():
+            # 아직 기록 중인 스레드와 같은 파일을 만지지 않도록 닫지 않고 둠
+            print("[ERROR] 저장 스레드가 응답하지 않음 - 마지막 샘플 일부가 기록되지 않았을 수 있음")
+        else:
+            if blob is not None:
+                sync_and_close(blob)
+            sync_and_close(f)
         picam2.stop()
         if SHOW_PREVIEW:
             cv2.destroyAllWindows()
 
+    if save_errors:
+        print(f"[ERROR] 저장 실패로 기록 중단: {save_errors[0]}")
+        print(f"        CSV(중단 시점까지): {csv_path}")
+        sys.exit(1)
+
     print(f"[DONE] CSV saved: {csv_path}")
-    if SAVE_IMAGE:
+    if SAVE_IMAGE and SAVE_IMAGE_BLOB:
+        print(f"[DONE] Images blob: {blob_path}")
+    elif SAVE_IMAGE:
         print(f"[DONE] Images dir: {images_dir}")
 
 